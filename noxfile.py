@@ -16,10 +16,11 @@ from __future__ import annotations
 
 import hashlib
 import os
-import re
 import shutil
 import sys
-from difflib import unified_diff
+import tempfile
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from tarfile import open as open_tar
 from zipfile import ZipFile
@@ -43,7 +44,30 @@ test_packages += "bare-c-module", "cmake-preset", "cmake-options"
 
 purity = {"namespace-project-b": True}
 
+# Where to find the py-build-cmake Wheel (resolved once)
+wheel_dir_env = os.getenv("PY_BUILD_CMAKE_WHEEL_DIR")
+wheel_dir = str(Path(wheel_dir_env).resolve()) if wheel_dir_env is not None else None
+default_dist_dir = str(project_dir / "dist")
 
+
+_normalize_table = str.maketrans("-.", "__")
+
+
+def normalize_name(name: str) -> str:
+    """Equivalent to re.sub(r"[-_.]+", "_", name).lower()"""
+    name = name.translate(_normalize_table)
+    while "__" in name:
+        name = name.replace("__", "_")
+    return name.lower()
+
+
+def clean(*paths: str | Path):
+    """Recursively remove the given directories, if they exist."""
+    for p in paths:
+        shutil.rmtree(p, ignore_errors=True)
+
+
+@lru_cache(maxsize=None)
 def get_contents_subs(ext_suffix: str):
     if ext_suffix.endswith(".pyd"):
         dbg_suffix = ".pdb"
@@ -64,6 +88,67 @@ def get_contents_subs(ext_suffix: str):
     }
 
 
+@lru_cache(maxsize=None)
+def get_template_env(name: str):
+    d = project_dir / "tests" / "expected_contents" / name
+    return jinja2.Environment(loader=jinja2.FileSystemLoader(d))
+
+
+@lru_cache(maxsize=None)
+def get_expected_contents(name: str, kind: str, ext_suffix: str) -> tuple[str, ...]:
+    """Render tests/expected_contents/{name}/{kind}.txt (once per run)."""
+    template = get_template_env(name).get_template(f"{kind}.txt")
+    contents = template.render(**get_contents_subs(ext_suffix)).split("\n")
+    return tuple(filter(bool, contents))
+
+
+def get_sdist_names(sdist: Path) -> list[str]:
+    # Stream the headers sequentially instead of building the full index
+    with open_tar(sdist, mode="r|gz") as t:
+        return [ti.name for ti in t]
+
+
+def get_wheel_names(whl: Path) -> list[str]:
+    # Only the central directory is read: members are never decompressed or
+    # CRC-checked. Note that infolist (unlike NameToInfo) keeps duplicates.
+    with ZipFile(whl, mode="r") as z:
+        return [zi.filename for zi in z.infolist()]
+
+
+def find_wheel(session: nox.Session, normname: str, plat: str) -> Path:
+    # Equivalent to globbing dist-nox/{normname}-{version}-*{plat}*.whl
+    prefix, suffix = f"{normname}-{version}-", ".whl"
+    whls = [
+        p
+        for p in Path("dist-nox").iterdir()
+        if p.name.startswith(prefix)
+        and p.name.endswith(suffix)
+        and plat in p.name[len(prefix) : -len(suffix)]
+    ]
+    if len(whls) != 1:
+        session.error(f"Unexpected number of Wheels {whls} ({prefix}*{plat}*{suffix})")
+    return whls[0]
+
+
+def compare_contents(
+    session: nox.Session, what: str, expect: tuple[str, ...], actual: list[str]
+):
+    expect_set, actual_set = frozenset(expect), frozenset(actual)
+    if expect_set == actual_set and len(expect) == len(actual):
+        return
+    # Report the files that are missing, unexpected or duplicated
+    problems = {
+        "missing": expect_set - actual_set,
+        "extra": actual_set - expect_set,
+        "duplicate": {n for n, c in Counter(actual).items() if c > 1},
+    }
+    msg = f"{what} contents mismatch:"
+    for label, names in problems.items():
+        if names:
+            msg += f"\n{label}:\n  " + "\n  ".join(sorted(names))
+    session.error(msg)
+
+
 def check_pkg_contents(
     session: nox.Session,
     name: str,
@@ -71,45 +156,27 @@ def check_pkg_contents(
     with_sdist=True,
     pure=False,
 ):
-    d = project_dir / "tests" / "expected_contents" / name
-    template_env = jinja2.Environment(loader=jinja2.FileSystemLoader(d))
-    normname = re.sub(r"[-_.]+", "_", name).lower()
+    normname = normalize_name(name)
     plat = "none" if pure else get_platform().replace(".", "_").replace("-", "_")
-    subs = get_contents_subs(ext_suffix)
     # Compare sdist contents
     sdist = Path(f"dist-nox/{normname}-{version}.tar.gz")
     if with_sdist:
-        sdist_template = template_env.get_template("sdist.txt")
-        sdist_expect = sdist_template.render(**subs).split("\n")
-        sdist_expect = sorted(filter(bool, sdist_expect))
-        with open_tar(sdist) as t:
-            sdist_actual = sorted(t.getnames())
-        if sdist_expect != sdist_actual:
-            diff = "\n".join(unified_diff(sdist_expect, sdist_actual))
-            session.error("sdist contents mismatch:\n" + diff)
+        sdist_expect = get_expected_contents(name, "sdist", ext_suffix)
+        sdist_actual = get_sdist_names(sdist)
+        compare_contents(session, "sdist", sdist_expect, sdist_actual)
     # Find Wheel
-    whl_pattern = f"dist-nox/{normname}-{version}-*{plat}*.whl"
-    whls = list(Path().glob(whl_pattern))
-    if len(whls) != 1:
-        session.error(f"Unexpected number of Wheels {whls} ({whl_pattern})")
-    whl = whls[0]
+    whl = find_wheel(session, normname, plat)
     # Compare Wheel contents
-    whl_template = template_env.get_template("whl.txt")
-    whl_expect = whl_template.render(**subs).split("\n")
-    whl_expect = sorted(filter(bool, whl_expect))
-    with ZipFile(whl) as z:
-        whl_actual = sorted(z.namelist())
-    if whl_expect != whl_actual:
-        diff = "\n".join(unified_diff(whl_expect, whl_actual))
-        session.error("Wheel contents mismatch:\n" + diff)
+    whl_expect = get_expected_contents(name, "whl", ext_suffix)
+    whl_actual = get_wheel_names(whl)
+    compare_contents(session, "Wheel", whl_expect, whl_actual)
 
 
 def test_example_project(
     session: nox.Session, name: str, ext_suffix: str, dir: Path = Path("examples")
 ):
     with session.chdir(dir / name):
-        shutil.rmtree(".py-build-cmake_cache", ignore_errors=True)
-        shutil.rmtree("dist-nox", ignore_errors=True)
+        clean(".py-build-cmake_cache", "dist-nox")
         session.run("python", "-m", "build", ".", "-o", "dist-nox")
         pure = purity.get(name, False)
         check_pkg_contents(session, name, ext_suffix, pure=pure)
@@ -117,7 +184,7 @@ def test_example_project(
         session.run("pytest")
 
 
-def get_ext_suffix(name: str):
+def compute_ext_suffix(name: str):
     impl = sys.implementation
     py_v = sys.version_info
     ext_suffix = dist_sysconfig.get_config_var("EXT_SUFFIX")
@@ -140,30 +207,59 @@ def get_ext_suffix(name: str):
     return ext_suffix
 
 
+# Extension suffixes for each project, or None if it should be skipped
+ext_suffixes = {name: compute_ext_suffix(name) for name in examples + test_packages}
+
+
+def get_ext_suffix(name: str):
+    return ext_suffixes[name]
+
+
+def install_tools(session: nox.Session, *pkgs: str):
+    """Install or upgrade the given packages in the session, using uv instead
+    of pip if it is available."""
+    uv = shutil.which("uv")
+    if uv is None:
+        session.install("-U", *pkgs)
+    else:
+        env = {"VIRTUAL_ENV": session.virtualenv.location}
+        session.run(uv, "pip", "install", "-U", *pkgs, env=env, external=True)
+
+
+_dist_dir_built = False
+
+
+def get_dist_dir(session: nox.Session) -> str:
+    """Get the folder containing the py-build-cmake Wheel to test. If the
+    PY_BUILD_CMAKE_WHEEL_DIR environment variable is not set, py-build-cmake is
+    built (only once for all sessions in this nox invocation)."""
+    global _dist_dir_built  # noqa: PLW0603
+    if wheel_dir is not None:
+        return wheel_dir
+    if not _dist_dir_built:
+        session.run("python", "-m", "build", ".", "-o", default_dist_dir)
+        _dist_dir_built = True
+    return default_dist_dir
+
+
+def install_py_build_cmake(session: nox.Session):
+    session.env["PIP_FIND_LINKS"] = get_dist_dir(session)
+    session.install(f"py-build-cmake=={version}")
+
+
 @nox.session
 def find_python(session: nox.Session):
-    session.install("-U", "pip", "build", "pytest")
-    dist_dir = os.getenv("PY_BUILD_CMAKE_WHEEL_DIR")
-    if dist_dir is None:
-        session.run("python", "-m", "build", ".")
-        dist_dir = "dist"
-    session.env["PIP_FIND_LINKS"] = str(Path(dist_dir).resolve())
-    session.install(f"py-build-cmake=={version}")
+    install_tools(session, "pip", "build", "pytest")
+    install_py_build_cmake(session)
     with session.chdir("test-packages/find-python"):
-        shutil.rmtree(".py-build-cmake_cache", ignore_errors=True)
-        shutil.rmtree("dist-nox", ignore_errors=True)
+        clean(".py-build-cmake_cache", "dist-nox")
         session.run("python", "-m", "build", ".", "-o", "dist-nox")
 
 
 @nox.session
 def example_projects(session: nox.Session):
-    session.install("-U", "pip", "build", "pytest")
-    dist_dir = os.getenv("PY_BUILD_CMAKE_WHEEL_DIR")
-    if dist_dir is None:
-        session.run("python", "-m", "build", ".")
-        dist_dir = "dist"
-    session.env["PIP_FIND_LINKS"] = str(Path(dist_dir).resolve())
-    session.install(f"py-build-cmake=={version}")
+    install_tools(session, "pip", "build", "pytest")
+    install_py_build_cmake(session)
     for name in examples:
         ext_suffix = get_ext_suffix(name)
         if ext_suffix is not None:
@@ -173,13 +269,8 @@ def example_projects(session: nox.Session):
 @nox.session
 def test_projects(session: nox.Session):
     dir = Path("test-packages")
-    session.install("-U", "pip", "build", "pytest")
-    dist_dir = os.getenv("PY_BUILD_CMAKE_WHEEL_DIR")
-    if dist_dir is None:
-        session.run("python", "-m", "build", ".")
-        dist_dir = "dist"
-    session.env["PIP_FIND_LINKS"] = str(Path(dist_dir).resolve())
-    session.install(f"py-build-cmake=={version}")
+    install_tools(session, "pip", "build", "pytest")
+    install_py_build_cmake(session)
     for name in test_packages:
         ext_suffix = get_ext_suffix(name)
         if ext_suffix is not None:
@@ -188,16 +279,10 @@ def test_projects(session: nox.Session):
 
 @nox.session
 def component(session: nox.Session):
-    session.install("-U", "pip", "build", "pytest")
-    dist_dir = os.getenv("PY_BUILD_CMAKE_WHEEL_DIR")
-    if dist_dir is None:
-        session.run("python", "-m", "build", ".")
-        dist_dir = "dist"
-    session.env["PIP_FIND_LINKS"] = str(Path(dist_dir).resolve())
-    session.install(f"py-build-cmake=={version}")
+    install_tools(session, "pip", "build", "pytest")
+    install_py_build_cmake(session)
     with session.chdir("examples/minimal-debug-component"):
-        shutil.rmtree(".py-build-cmake_cache", ignore_errors=True)
-        shutil.rmtree("dist-nox", ignore_errors=True)
+        clean(".py-build-cmake_cache", "dist-nox")
         session.run("python", "-m", "build", "-w", ".", "-o", "dist-nox")
         session.run("python", "-m", "build", "-w", "./debug", "-o", "dist-nox")
         ext_suffix = get_ext_suffix("minimal")
@@ -213,27 +298,18 @@ def component(session: nox.Session):
 def reproducible(session: nox.Session):
     if os.name != "posix":
         session.skip("Skipping reproducible builds")
-    session.install("-U", "pip", "build", "pytest")
-    dist_dir = os.getenv("PY_BUILD_CMAKE_WHEEL_DIR")
-    if dist_dir is None:
-        session.run("python", "-m", "build", ".")
-        dist_dir = "dist"
-    session.env["PIP_FIND_LINKS"] = str(Path(dist_dir).resolve())
+    install_tools(session, "pip", "build", "pytest")
+    session.env["PIP_FIND_LINKS"] = get_dist_dir(session)
     session.env["SOURCE_DATE_EPOCH"] = "1732565790"
 
     def build_and_hash(name):
-        shutil.rmtree(".py-build-cmake_cache", ignore_errors=True)
-        shutil.rmtree("dist-nox", ignore_errors=True)
+        clean(".py-build-cmake_cache", "dist-nox")
         override = "override.cmake.options.REPRODUCIBLE_PROJECT_DIR=true"
         session.run("python", "-m", "build", "-o", "dist-nox", "-C", override)
-        normname = re.sub(r"[-_.]+", "_", name).lower()
+        normname = normalize_name(name)
         plat = get_platform().replace(".", "_").replace("-", "_")
         sdist = Path(f"dist-nox/{normname}-{version}.tar.gz")
-        whl_pattern = f"dist-nox/{normname}-{version}-*{plat}*.whl"
-        whls = list(Path().glob(whl_pattern))
-        if len(whls) != 1:
-            session.error(f"Unexpected number of Wheels {whls} ({whl_pattern})")
-        whl = whls[0]
+        whl = find_wheel(session, normname, plat)
         sdist_hash = hashlib.sha256(sdist.read_bytes()).hexdigest()
         whl_hash = hashlib.sha256(whl.read_bytes()).hexdigest()
         return sdist_hash, whl_hash
@@ -259,7 +335,6 @@ def test_editable(
     ext_suffix = get_ext_suffix(name)
     if ext_suffix is None:
         return
-    tmpdir = Path(session.create_tmp()).resolve()
     m = mode.split("+", 1)
     bh = len(m) > 1 and m[1] == "build_hook"
     skip_wrapper = ("namespace", "bare", "cmake-preset", "cmake-options")
@@ -267,26 +342,23 @@ def test_editable(
         return
     if m[0] == "symlink" and name == "minimal-program":
         return
-    try:
-        with session.chdir(dir / name):
-            shutil.rmtree(".py-build-cmake_cache", ignore_errors=True)
-            with (tmpdir / f"{mode}.toml").open("w") as f:
-                f.write(f'[editable]\nmode = "{m[0]}"\n')
-                f.write(f"build_hook = {str(bh).lower()}")
-            args = ("--config-settings=--local=" + f.name,)
-            if bh:
-                args += ("--no-build-isolation",)
-            session.install("-e", ".", *args)
-            session.run("pytest")
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
+    with tempfile.TemporaryDirectory() as tmpdir, session.chdir(dir / name):
+        clean(".py-build-cmake_cache")
+        with (Path(tmpdir) / f"{mode}.toml").open("w") as f:
+            f.write(f'[editable]\nmode = "{m[0]}"\n')
+            f.write(f"build_hook = {str(bh).lower()}")
+        args = ("--config-settings=--local=" + f.name,)
+        if bh:
+            args += ("--no-build-isolation",)
+        session.install("-e", ".", *args)
+        session.run("pytest")
 
 
 @nox.session
 @nox.parametrize("mode", ["symlink", "symlink+build_hook", "hook", "wrapper"])
 def editable(session: nox.Session, mode):
-    session.install(
-        "-U",
+    install_tools(
+        session,
         "pip",
         "build",
         "pytest",
@@ -297,12 +369,7 @@ def editable(session: nox.Session, mode):
         "cmake",
         "ninja",
     )
-    dist_dir = os.getenv("PY_BUILD_CMAKE_WHEEL_DIR")
-    if dist_dir is None:
-        session.run("python", "-m", "build", ".")
-        dist_dir = "dist"
-    session.env["PIP_FIND_LINKS"] = str(Path(dist_dir).resolve())
-    session.install(f"py-build-cmake=={version}")
+    install_py_build_cmake(session)
     for name in examples:
         test_editable(session, name, mode)
     for name in test_packages:
@@ -311,10 +378,9 @@ def editable(session: nox.Session, mode):
 
 @nox.session
 def tests(session: nox.Session):
-    session.install("-U", "pip", "pytest")
-    dist_dir = os.getenv("PY_BUILD_CMAKE_WHEEL_DIR")
-    if dist_dir:
-        session.env["PIP_FIND_LINKS"] = str(Path(dist_dir).resolve())
+    install_tools(session, "pip", "pytest")
+    if wheel_dir_env:  # an empty value is ignored here
+        session.env["PIP_FIND_LINKS"] = wheel_dir
         session.install(f"py-build-cmake=={version}")
     else:
         session.install(".")
@@ -18,6 +18,7 @@ zip_files = [
 ]
 
 for f in tar_files:
-    print(*sorted(tar_open(f).getnames()), sep="\n", end="\n\n")
+    with tar_open(f, mode="r|*") as t:
+        print(*sorted(ti.name for ti in t), sep="\n", end="\n\n")
 for f in zip_files:
     print(*sorted(ZipFile(f).namelist()), sep="\n", end="\n\n")
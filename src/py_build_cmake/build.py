@@ -1,23 +1,22 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import logging
 import os
 import platform
 import shutil
+import sys
 import sysconfig
 import tempfile
+import zipfile
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
-
-from .commands.cmake import (
-    CMakeBuildSettings,
-    CMakeConfigureSettings,
-    CMakeInstallSettings,
-    CMaker,
-    CMakeSettings,
-)
-from .commands.cmd_runner import CommandRunner
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable
+
+from .commands.cmd_runner import CommandRunner, PrefixedCommandRunner
 from .commands.try_run import check_cmake_program, check_stubgen_program
 from .common import (
     BuildPaths,
@@ -34,23 +33,35 @@ from .common import (
 )
 from .config import load as config_load
 from .config.dynamic import find_module, update_dynamic_metadata
-from .export import editable as export_editable
 from .export import metadata as export_metadata
 from .export import util as export_util
-from .export.editable.build_hook import write_build_hook
 from .export.native_tags import get_interpreter_name
-from .export.sdist import SdistBuilder
 from .export.tags import convert_wheel_tags, get_cross_tags, get_native_tags, is_pure
-from .export.wheel import WheelBuilder
+
+if TYPE_CHECKING:
+    from .commands.cmake import CMaker
 
 logger = logging.getLogger(__name__)
 
+# Keys in the config_settings dict for the backend's own options
+_VERBOSE_KEYS = frozenset({"verbose", "--verbose", "V", "-V"})
+_PARALLEL_CONFIGS_KEYS = frozenset({"parallel_configs", "--parallel_configs"})
+_INCREMENTAL_KEYS = frozenset({"incremental", "--incremental"})
+_KEEP_BUILD_DIR_KEYS = frozenset({"keep_build_dir", "--keep_build_dir"})
+_LOGLEVEL_KEYS = frozenset({"loglevel", "--loglevel"})
+
 
 class _BuildBackend:
+    # Whether the log handlers have been set up, see configure_logging
+    logging_configured: ClassVar[bool] = False
+
     # --- Constructor ---------------------------------------------------------
 
     def __init__(self) -> None:
         self.runner: CommandRunner = CommandRunner()
+        self.parallel_configs: bool = False
+        self.incremental: bool = False
+        self.keep_build_dir: bool = False
 
     @property
     def verbose(self):
@@ -77,20 +88,48 @@ class _BuildBackend:
         """https://www.python.org/dev/peps/pep-0517/#get-requires-for-build-sdist"""
         return []
 
+    def prepare_metadata_for_build_wheel(
+        self, metadata_directory, config_settings=None
+    ):
+        """https://www.python.org/dev/peps/pep-0517/#prepare-metadata-for-build-wheel"""
+        try:
+            self.parse_config_settings(config_settings)
+
+            src_dir = Path().resolve()
+            cfg, module = self.read_all_metadata(src_dir, config_settings, self.verbose)
+            pkg_info = self.get_pkg_info(cfg, module)
+            distinfo_dir = self.write_distinfo(Path(metadata_directory), cfg, pkg_info)
+            self.write_wheel_file(distinfo_dir, cfg, self.get_cmake_config(cfg))
+            return distinfo_dir.name
+        except Exception as e:
+            format_and_rethrow_exception(e)
+
+    def prepare_metadata_for_build_editable(
+        self, metadata_directory, config_settings=None
+    ):
+        """https://www.python.org/dev/peps/pep-0660/#prepare-metadata-for-build-editable"""
+        return self.prepare_metadata_for_build_wheel(
+            metadata_directory, config_settings
+        )
+
     def build_wheel(
         self, wheel_directory, config_settings=None, metadata_directory=None
     ):
         """https://www.python.org/dev/peps/pep-0517/#build-wheel"""
+        # The metadata is regenerated rather than copied from metadata_directory
+        # (if specified): it is identical to the output of
+        # prepare_metadata_for_build_wheel, and cheap to create.
         try:
-            assert metadata_directory is None
-
             # Parse options
             self.parse_config_settings(config_settings)
 
             # Build wheel
-            with tempfile.TemporaryDirectory() as tmp_build_dir:
+            src_dir = Path().resolve()
+            cfg = self.read_config(src_dir, config_settings, self.verbose)
+            keep = self.keep_build_dir
+            with self.temporary_build_dir(src_dir, cfg, keep) as tmp_build_dir:
                 return self.build_wheel_in_dir(
-                    wheel_directory, tmp_build_dir, config_settings
+                    wheel_directory, tmp_build_dir, config_settings, cfg
                 )
         except Exception as e:
             format_and_rethrow_exception(e)
@@ -100,15 +139,16 @@ class _BuildBackend:
     ):
         """https://www.python.org/dev/peps/pep-0660/#build-editable"""
         try:
-            assert metadata_directory is None
-
             # Parse options
             self.parse_config_settings(config_settings)
 
             # Build wheel
-            with tempfile.TemporaryDirectory() as tmp_build_dir:
+            src_dir = Path().resolve()
+            cfg = self.read_config(src_dir, config_settings, self.verbose)
+            keep = self.keep_build_dir
+            with self.temporary_build_dir(src_dir, cfg, keep) as tmp_build_dir:
                 return self.build_wheel_in_dir(
-                    wheel_directory, tmp_build_dir, config_settings, editable=True
+                    wheel_directory, tmp_build_dir, config_settings, cfg, editable=True
                 )
         except Exception as e:
             format_and_rethrow_exception(e)
@@ -126,21 +166,51 @@ class _BuildBackend:
     # --- Parsing config options and metadata ---------------------------------
 
     @staticmethod
-    def is_verbose_enabled(config_settings: dict | None):
-        truthy = lambda x: x.lower() in ("", "1", "true", "yes", "y")
+    def get_last_setting(config_settings: dict | None, keys: frozenset[str]):
+        """Get the value of the last of the given keys in the config settings,
+        or None if none of the keys are present."""
+        last_val = None
         if config_settings is not None:
-            verbose_keys = {"verbose", "--verbose", "V", "-V"}
-            verbose_opts = {
-                k: v for k, v in config_settings.items() if k in verbose_keys
-            }
-            if verbose_opts:
-                last_val = next(reversed(list(verbose_opts.values())))
-                return truthy(last_val)
-        env_verbose = os.environ.get("PY_BUILD_CMAKE_VERBOSE")
-        if env_verbose is not None:
-            return truthy(env_verbose)
+            for k, v in config_settings.items():
+                if k in keys:
+                    last_val = v
+        return last_val
+
+    @staticmethod
+    def is_flag_enabled(config_settings: dict | None, keys: frozenset[str], env: str):
+        truthy = lambda x: x.lower() in ("", "1", "true", "yes", "y")
+        last_val = _BuildBackend.get_last_setting(config_settings, keys)
+        if last_val is not None:
+            return truthy(last_val)
+        env_val = os.environ.get(env)
+        if env_val is not None:
+            return truthy(env_val)
         return False
 
+    @staticmethod
+    def is_verbose_enabled(config_settings: dict | None):
+        return _BuildBackend.is_flag_enabled(
+            config_settings, _VERBOSE_KEYS, "PY_BUILD_CMAKE_VERBOSE"
+        )
+
+    @staticmethod
+    def is_parallel_configs_enabled(config_settings: dict | None):
+        return _BuildBackend.is_flag_enabled(
+            config_settings, _PARALLEL_CONFIGS_KEYS, "PY_BUILD_CMAKE_PARALLEL_CONFIGS"
+        )
+
+    @staticmethod
+    def is_incremental_enabled(config_settings: dict | None):
+        return _BuildBackend.is_flag_enabled(
+            config_settings, _INCREMENTAL_KEYS, "PY_BUILD_CMAKE_INCREMENTAL"
+        )
+
+    @staticmethod
+    def is_keep_build_dir_enabled(config_settings: dict | None):
+        return _BuildBackend.is_flag_enabled(
+            config_settings, _KEEP_BUILD_DIR_KEYS, "PY_BUILD_CMAKE_KEEP_BUILD_DIR"
+        )
+
     @staticmethod
     def get_log_level(config_settings: dict | None) -> int:
         def parse_log_level(loglevel: str) -> int:
@@ -150,30 +220,40 @@ class _BuildBackend:
             msg = f"Invalid log level: {loglevel}"
             raise ValueError(msg)
 
-        if config_settings is not None:
-            log_keys = {"loglevel", "--loglevel"}
-            log_opts = {k: v for k, v in config_settings.items() if k in log_keys}
-            if log_opts:
-                last_val = next(reversed(list(log_opts.values())))
-                return parse_log_level(last_val)
+        last_val = _BuildBackend.get_last_setting(config_settings, _LOGLEVEL_KEYS)
+        if last_val is not None:
+            return parse_log_level(last_val)
         env_log = os.environ.get("PY_BUILD_CMAKE_LOGLEVEL")
         if env_log is not None:
             return parse_log_level(env_log)
         return logging.INFO
 
+    @staticmethod
+    def configure_logging(level: int):
+        """Set up the log handlers when called for the first time, subsequent
+        calls (e.g. from other hooks in the same process) only update the log
+        level."""
+        if _BuildBackend.logging_configured:
+            logging.getLogger().setLevel(level)
+            return
+        if "GITHUB_ACTIONS" in os.environ:
+            formatter = logformat.GitHubActionsFormatter()
+            handler = logging.StreamHandler()
+            handler.setFormatter(formatter)
+            logging.basicConfig(level=level, handlers=[handler])
+        else:
+            logging.basicConfig(level=level)
+        _BuildBackend.logging_configured = True
+
     def parse_config_settings(self, config_settings: dict | None):
         try:
-            level = self.get_log_level(config_settings)
-            if "GITHUB_ACTIONS" in os.environ:
-                formatter = logformat.GitHubActionsFormatter()
-                handler = logging.StreamHandler()
-                handler.setFormatter(formatter)
-                logging.basicConfig(level=level, handlers=[handler])
-            else:
-                logging.basicConfig(level=level)
+            self.configure_logging(self.get_log_level(config_settings))
         except ValueError as e:
             logger.error("Invalid log level specified", exc_info=e)
         self.runner.verbose = self.is_verbose_enabled(config_settings)
+        self.parallel_configs = self.is_parallel_configs_enabled(config_settings)
+        self.incremental = self.is_incremental_enabled(config_settings)
+        self.keep_build_dir = self.is_keep_build_dir_enabled(config_settings)
 
     @staticmethod
     def get_requires_build_project(
@@ -191,15 +271,43 @@ class _BuildBackend:
 
     # --- Building wheels -----------------------------------------------------
 
+    @staticmethod
+    @contextlib.contextmanager
+    def temporary_build_dir(src_dir: Path, cfg: Config, keep_build_dir: bool):
+        """Directory for the staging area and other temporary files. If the
+        keep_build_dir option is set, a folder in the project's cache directory
+        is used, which is only cleared at the start of the next build, and
+        can be inspected after the build. Otherwise, a temporary directory is
+        created in PY_BUILD_CMAKE_TMPDIR (if set), e.g. to stage the files on
+        a RAM disk (/dev/shm), at the cost of memory usage. Unlike TMPDIR, this
+        does not affect CMake and the compilers."""
+        if keep_build_dir:
+            build_cfg_name = _BuildBackend.get_build_config_name(cfg, 0)
+            tmp_dir = src_dir / ".py-build-cmake_cache" / f"staging-{build_cfg_name}"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            yield str(tmp_dir)
+        else:
+            # Don't fail the build if e.g. a virus scanner is still holding on
+            # to one of the temporary files.
+            kwargs = (
+                {"ignore_cleanup_errors": True} if sys.version_info >= (3, 10) else {}
+            )
+            tmp_base = os.environ.get("PY_BUILD_CMAKE_TMPDIR") or None
+            with tempfile.TemporaryDirectory(dir=tmp_base, **kwargs) as tmp_dir:
+                yield tmp_dir
+
     def build_wheel_in_dir(
-        self, wheel_dir, tmp_build_dir, config_settings, editable=False
+        self, wheel_dir, tmp_build_dir, config_settings, cfg: Config, editable=False
     ):
         """This is the main function that contains all steps necessary to build
         a complete wheel package, including the CMake builds etc."""
 
         # Load metadata from the pyproject.toml file
         src_dir = Path().resolve()
-        cfg, module = self.read_all_metadata(src_dir, config_settings, self.verbose)
+        cfg, module = self.read_all_metadata(
+            src_dir, config_settings, self.verbose, cfg
+        )
         pkg_info = self.get_pkg_info(cfg, module)
         cmake_cfg = self.get_cmake_config(cfg)
 
@@ -208,40 +316,48 @@ class _BuildBackend:
 
         # Copy the module's Python source files to the temporary folder
         if not editable:
-            export_util.copy_pkg_source_to(paths.staging_dir, module)
+            # Without CMake, nothing writes to the staged source files, which
+            # are only read when creating the Wheel, so symlinks suffice
+            link = not cmake_cfg and os.name != "nt"
+            export_util.copy_pkg_source_to(paths.staging_dir, module, link)
         else:
+            from .export import editable as export_editable
+
             paths = export_editable.do_editable_install(cfg, paths, module)
 
         # Create dist-info folder
-        distinfo_dir = f"{pkg_info.norm_name}-{pkg_info.version}.dist-info"
-        distinfo_dir = paths.pkg_staging_dir / distinfo_dir
-        distinfo_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write metadata, license and entry points to Wheel's distinfo
-        export_metadata.write_metadata(cfg, distinfo_dir)
-        export_metadata.write_license_files(cfg, distinfo_dir)
-        export_metadata.write_entry_points(cfg, distinfo_dir)
+        self.write_distinfo(paths.pkg_staging_dir, cfg, pkg_info)
 
         # Configure, build and install the CMake project
+        cmakers = {}
+        build_cfg_names = self.get_build_config_names(cfg, cmake_cfg)
         for idx, cmkcfg in cmake_cfg.items():
-            build_cfg_name = _BuildBackend.get_build_config_name(cfg, idx)
-            path = cmkcfg["build_path"]
-            path = str(path).replace("{build_config}", build_cfg_name)
-            build_dir = Path(path)
-            cmaker = self.get_cmaker(
+            path = str(cmkcfg["build_path"])
+            build_dir = Path(path.replace("{build_config}", build_cfg_names[idx]))
+            cmakers[idx] = self.get_cmaker(
                 paths.source_dir,
                 build_dir,
                 paths.staging_dir,
                 cmkcfg,
                 cfg.cross,
                 pkg_info,
+                incremental=self.incremental,
                 runner=self.runner,
             )
-            cmaker.configure()
-            cmaker.build()
+        # Independent configurations can optionally be built concurrently
+        parallel = self.parallel_configs and self.can_build_concurrently(cmakers)
+        if parallel:
+            self.configure_and_build_concurrently(list(cmakers.values()))
+        # Installation is always sequential, in the order of the indices
+        for idx, cmaker in cmakers.items():
+            if not parallel:
+                cmaker.configure()
+                cmaker.build()
             cmaker.install()
 
             if editable:
+                from .export.editable.build_hook import write_build_hook
+
                 write_build_hook(cfg, paths.pkg_staging_dir, module, cmaker, idx)
 
         # Generate .pyi stubs (for the Python files only)
@@ -259,22 +375,43 @@ class _BuildBackend:
             module_name=module.name if module is not None else "",
         )
 
+    @staticmethod
+    def write_distinfo(
+        parent_dir: Path, cfg: Config | ComponentConfig, pkg_info: PackageInfo
+    ) -> Path:
+        """Create the dist-info folder in the given directory, and write the
+        metadata, license and entry points to it."""
+        distinfo_name = f"{pkg_info.norm_name}-{pkg_info.version}.dist-info"
+        distinfo_dir = parent_dir / distinfo_name
+        distinfo_dir.mkdir(parents=True, exist_ok=True)
+        export_metadata.write_metadata(cfg, distinfo_dir)
+        export_metadata.write_license_files(cfg, distinfo_dir)
+        export_metadata.write_entry_points(cfg, distinfo_dir)
+        return distinfo_dir
+
     @staticmethod
     def get_default_paths(wheel_dir, tmp_build_dir, src_dir, cfg):
         build_cfg_name = _BuildBackend.get_build_config_name(cfg, 0)
         build_dir = src_dir / ".py-build-cmake_cache" / build_cfg_name
+        temp_dir = Path(tmp_build_dir)
+        staging_dir = temp_dir / "staging"
         return BuildPaths(
             source_dir=src_dir,
             build_dir=build_dir,
             wheel_dir=Path(wheel_dir),
-            temp_dir=Path(tmp_build_dir),
-            staging_dir=Path(tmp_build_dir) / "staging",
-            pkg_staging_dir=Path(tmp_build_dir) / "staging",
+            temp_dir=temp_dir,
+            staging_dir=staging_dir,
+            pkg_staging_dir=staging_dir,
         )
 
     @staticmethod
-    def read_all_metadata(src_dir, config_settings, verbose) -> tuple[Config, Module]:
-        cfg = _BuildBackend.read_config(src_dir, config_settings, verbose)
+    def read_all_metadata(
+        src_dir, config_settings, verbose, cfg: Config | None = None
+    ) -> tuple[Config, Module]:
+        """Read the configuration (unless already given) and the dynamic
+        metadata from the module."""
+        if cfg is None:
+            cfg = _BuildBackend.read_config(src_dir, config_settings, verbose)
         module = find_module(cfg.module, src_dir)
         modfile = module.full_file
         if cfg.standard_metadata.dynamic:
@@ -318,11 +455,25 @@ class _BuildBackend:
             src_dir / "pyproject.toml", config_settings, verbose
         )
 
+    @staticmethod
+    def write_wheel_file(distinfo_dir: Path, cfg: Config, cmake_cfg):
+        """Write the WHEEL file to the dist-info folder, with the same tags as
+        create_wheel would use."""
+        from .export.wheel import WheelBuilder
+
+        wheel_cfg = _BuildBackend.get_wheel_config(cfg)
+        pure = is_pure(wheel_cfg, cmake_cfg)
+        tags = _BuildBackend.get_wheel_tags(pure, wheel_cfg, cfg.cross)
+        tag_triples = itertools.product(tags["pyver"], tags["abi"], tags["arch"])
+        WheelBuilder.write_wheel_file(distinfo_dir, pure, tag_triples, (1, 0))
+
     @staticmethod
     def create_wheel(
         paths: BuildPaths, cfg: Config, cmake_cfg, package_info: PackageInfo
     ):
         """Create a wheel package from the build directory."""
+        from .export.wheel import WheelBuilder
+
         whl = WheelBuilder()
         whl.name = package_info.norm_name
         whl.version = package_info.version
@@ -335,6 +486,8 @@ class _BuildBackend:
         whl.dirname = paths.wheel_dir
         if wheel_cfg.get("build_tag"):
             whl.buildver = wheel_cfg["build_tag"]
+        if wheel_cfg.get("compression") == "stored":
+            whl.compression = zipfile.ZIP_STORED
         wheel_path = whl.build(whl_paths, tags=tags, wheel_version=(1, 0))
         logger.debug("Built Wheel: %s", wheel_path)
         return str(Path(wheel_path).relative_to(paths.wheel_dir))
@@ -344,7 +497,7 @@ class _BuildBackend:
         plat = wheel_cfg.get("platform_tag", "")
         guess_plat = "guess" in plat
         if pure:
-            tags = {"pyver": ["py3"]}
+            tags = {"pyver": ["py3"], "abi": ["none"], "arch": ["any"]}
         elif cross_cfg:
             if guess_plat:
                 msg = "Option `wheel.platform_tag=guess` is not supported when "
@@ -367,8 +520,8 @@ class _BuildBackend:
             cmake_cfg = cfg.cmake.get("cross")
         if not cmake_cfg:
             return {}
-        sort_cfg = sorted(cmake_cfg.items(), key=lambda item: int(item[0]))
-        return {int(key): value for key, value in sort_cfg}
+        int_cfg = ((int(key), value) for key, value in cmake_cfg.items())
+        return dict(sorted(int_cfg, key=itemgetter(0)))
 
     @staticmethod
     def get_wheel_config(cfg: Config):
@@ -380,6 +533,8 @@ class _BuildBackend:
     # --- Building sdists -----------------------------------------------------
 
     def do_build_sdist(self, sdist_directory, config_settings):
+        from .export.sdist import SdistBuilder
+
         # Load metadata
         src_dir = Path().resolve()
         pyproject = src_dir / "pyproject.toml"
@@ -398,6 +553,8 @@ class _BuildBackend:
             include_patterns=sdist_cfg.get("include_patterns", []),
             exclude_patterns=sdist_cfg.get("exclude_patterns", []),
         )
+        if "compression_level" in sdist_cfg:
+            sdist_builder.compresslevel = sdist_cfg["compression_level"]
         sdist_tar = sdist_builder.build(Path(sdist_directory))
         return str(Path(sdist_tar).relative_to(sdist_directory))
 
@@ -411,8 +568,17 @@ class _BuildBackend:
         cmake_cfg: dict,
         cross_cfg: dict | None,
         package_info: PackageInfo,
+        incremental: bool = False,
         **kwargs,
     ):
+        from .commands.cmake import (
+            CMakeBuildSettings,
+            CMakeConfigureSettings,
+            CMakeInstallSettings,
+            CMaker,
+            CMakeSettings,
+        )
+
         # Optionally include the cross-compilation settings
         if cross_cfg:
             cross_compiling = True
@@ -467,12 +633,14 @@ class _BuildBackend:
         generator: str | None = cmake_cfg.get("generator")
         make_program: Path | None = None
         if generator is not None and "ninja" in generator.lower():
-            with contextlib.suppress(ImportError):
-                import ninja  # type: ignore[import-not-found]
+            make_program = _BuildBackend.get_ninja_program()
 
-                make_program = Path(ninja.BIN_DIR) / "ninja"
-                if platform.system() == "Windows":
-                    make_program = make_program.with_suffix(".exe")
+        # Optionally use a compiler launcher such as ccache
+        launcher: str | None = cmake_cfg.get("compiler_launcher")
+        if launcher == "auto":
+            launcher = shutil.which("ccache") or shutil.which("sccache")
+            logger.debug("Compiler launcher: %s", launcher)
+        compiler_launcher = Path(launcher) if launcher else None
 
         # CMake options
         return CMaker(
@@ -495,6 +663,8 @@ class _BuildBackend:
                 preset=cmake_cfg.get("preset"),
                 generator=generator,
                 make_program=make_program,
+                compiler_launcher=compiler_launcher,
+                incremental=incremental,
                 cross_compiling=cross_compiling,
                 **cross_opts,
             ),
@@ -514,6 +684,69 @@ class _BuildBackend:
             **kwargs,
         )
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_ninja_program() -> Path | None:
+        """Path to the Ninja executable of the ninja package, if installed.
+        Looked up only once, even if there are multiple CMake configurations."""
+        try:
+            import ninja  # type: ignore[import-not-found]
+        except ImportError:
+            return None
+        make_program = Path(ninja.BIN_DIR) / "ninja"
+        if platform.system() == "Windows":
+            make_program = make_program.with_suffix(".exe")
+        return make_program
+
+    @staticmethod
+    def can_build_concurrently(cmakers: dict[int, CMaker]) -> bool:
+        """Multiple CMake configurations can only be built at the same time if
+        they use different build directories."""
+        build_dirs = {c.cmake_settings.build_path.resolve() for c in cmakers.values()}
+        return len(cmakers) > 1 and len(build_dirs) == len(cmakers)
+
+    @staticmethod
+    def configure_and_build_concurrently(cmakers: list[CMaker]):
+        """Configure and build the given CMake projects in parallel. Each
+        configuration runs in its own thread, which spends most of its time
+        waiting for the CMake subprocesses. The default number of build jobs is
+        divided over the configurations, to avoid oversubscribing the CPU.
+        Each configuration gets its own command runner, which prefixes the
+        output with the name of the build directory. If one of the
+        configurations fails, the others are stopped."""
+        shared_runners = [cmaker.runner for cmaker in cmakers]
+        runners = [
+            PrefixedCommandRunner(
+                cmaker.cmake_settings.build_path.name,
+                verbose=cmaker.runner.verbose,
+                dry=cmaker.runner.dry,
+            )
+            for cmaker in cmakers
+        ]
+        for cmaker, runner in zip(cmakers, runners):
+            cmaker.concurrent_builds = len(cmakers)
+            cmaker.runner = runner
+
+        def configure_and_build(cmaker: CMaker):
+            cmaker.configure()
+            cmaker.build()
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(cmakers)) as pool:
+                futures = [pool.submit(configure_and_build, c) for c in cmakers]
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                # Re-raise the first failure, after stopping the other builds
+                failed = [f for f in futures if f in done and f.exception()]
+                if failed:
+                    for future in futures:
+                        future.cancel()
+                    for runner in runners:
+                        runner.cancel()
+                    failed[0].result()
+        finally:
+            for cmaker, runner in zip(cmakers, shared_runners):
+                cmaker.runner = runner
+
     # --- Generate stubs ------------------------------------------------------
 
     def generate_stubs(self, paths: BuildPaths, module: Module, cfg: dict[str, Any]):
@@ -543,74 +776,7 @@ class _BuildBackend:
         self.copy_stubs(stubs_dir, paths)
 
     def copy_stubs(self, stubs_dir: Path, paths: BuildPaths):
-        dest = paths.staging_dir
-
-        def stubs_already_exists(dest_path: Path):
-            # We don't want to replace existing .pyi files.
-            dest_pyi = dest_path.with_suffix(".pyi")
-            if dest_pyi.exists():
-                return True
-            # If a directory with the same name already exists, we only
-            # want to copy our .pyi file if the directory does not contain
-            # an __init__.pyi file.
-            dest_dir = dest_path.with_suffix("")
-            dest_dir_init = dest_dir / "__init__.pyi"
-            return dest_dir.is_dir() and dest_dir_init.exists()
-
-        def handle_file(root_path: Path, f: str):
-            rel_path = root_path.relative_to(stubs_dir)
-            src_path = root_path / f
-            dest_path = dest / rel_path / f
-            if not stubs_already_exists(dest_path):
-                logger.debug("Copying generated stub  %s -> %s", src_path, dest_path)
-                shutil.move(str(src_path), str(dest_path))
-            else:
-                logger.info(
-                    "Not copying generated stub file %s because a .pyi "
-                    "file for the same module already exists",
-                    rel_path / f,
-                )
-
-        def handle_dir(root_path: Path, d: str) -> bool:
-            rel_path = root_path.relative_to(stubs_dir)
-            src_path = root_path / d
-            dest_path = dest / rel_path / d
-            dest_pyi = dest_path.with_suffix(".pyi")
-            # If the destination already has stubs for this (sub)module
-            # in a .pyi file, adding the folder as well would only cause
-            # confusion. Ignore the new folder and keep the existing
-            # .pyi file. Don't recurse into the folder either.
-            if dest_pyi.exists():
-                logger.info(
-                    "Not copying generated stub directory %s because a "
-                    ".pyi file for the same module already exists",
-                    rel_path / d,
-                )
-                return False
-            # If there's already a folder with the same name, simply recurse
-            # into it.
-            if dest_path.exists():
-                if dest_path.is_dir():
-                    return True
-                logger.debug(
-                    "Not copying generated stub directory %s because a "
-                    "file with the same name already exists",
-                    rel_path / d,
-                )
-                return False
-            # If there's neither a .pyi file nor a folder with the same
-            # name, we can safely move our folder to the destination, and
-            # there's no need to recurse any further.
-            logger.debug("Copying generated stubs %s -> %s", src_path, dest_path)
-            shutil.move(str(src_path), str(dest_path))
-            return False
-
-        for root, dirs, files in os.walk(stubs_dir):
-            root_path = Path(root)
-            is_pyi = lambda f: Path(f).suffix == ".pyi"
-            for f in filter(is_pyi, files):
-                handle_file(root_path, f)
-            dirs[:] = [d for d in dirs if handle_dir(root_path, d)]
+        export_util.move_stubs_to(paths.staging_dir, stubs_dir)
 
     # --- Misc helper functions -----------------------------------------------
 
@@ -619,19 +785,25 @@ class _BuildBackend:
         """Get a string representing the Python version, ABI and architecture,
         used to name the build folder so builds for different versions don't
         interfere."""
+        return _BuildBackend.get_build_config_names(cfg, [index])[index]
+
+    @staticmethod
+    def get_build_config_names(cfg: Config, indices: Iterable[int]):
+        """Get the build configuration names for multiple indices at once, so
+        the wheel tags only have to be determined once."""
         wheel_cfg = _BuildBackend.get_wheel_config(cfg)
         pure = is_pure(wheel_cfg, cfg.cmake)
         tags = _BuildBackend.get_wheel_tags(pure, wheel_cfg, cfg.cross)
         name = "-".join(".".join(x) for x in tags.values())
-        if index != 0:
-            name += f"-{index}"
-        return name
+        return {i: name if i == 0 else f"{name}-{i}" for i in indices}
 
 
 _BACKEND = _BuildBackend()
 get_requires_for_build_wheel = _BACKEND.get_requires_for_build_wheel
 get_requires_for_build_sdist = _BACKEND.get_requires_for_build_sdist
 get_requires_for_build_editable = _BACKEND.get_requires_for_build_editable
+prepare_metadata_for_build_wheel = _BACKEND.prepare_metadata_for_build_wheel
+prepare_metadata_for_build_editable = _BACKEND.prepare_metadata_for_build_editable
 build_wheel = _BACKEND.build_wheel
 build_sdist = _BACKEND.build_sdist
 build_editable = _BACKEND.build_editable
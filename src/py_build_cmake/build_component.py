@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-import tempfile
+from operator import itemgetter
 from pathlib import Path
 
 from .build import _BuildBackend as std_backend
@@ -12,7 +12,6 @@ from .common import (
     format_and_rethrow_exception,
 )
 from .config import load as config_load
-from .export import metadata as export_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +21,7 @@ class _BuildComponentBackend:
 
     def __init__(self) -> None:
         self.runner: CommandRunner = CommandRunner()
+        self.keep_build_dir: bool = False
 
     @property
     def verbose(self):
@@ -54,20 +54,55 @@ class _BuildComponentBackend:
         """https://www.python.org/dev/peps/pep-0517/#get-requires-for-build-sdist"""
         return []
 
+    def prepare_metadata_for_build_wheel(
+        self, metadata_directory, config_settings=None
+    ):
+        """https://www.python.org/dev/peps/pep-0517/#prepare-metadata-for-build-wheel"""
+        try:
+            self.parse_config_settings(config_settings)
+
+            comp_source_dir = Path().resolve()
+            comp_cfg = self.read_all_metadata(
+                comp_source_dir, config_settings, self.verbose
+            )
+            src_dir = comp_cfg.main_project.resolve()
+            cfg, module = std_backend.read_all_metadata(
+                src_dir, config_settings, self.verbose
+            )
+            pkg_info = std_backend.get_pkg_info(comp_cfg, module)
+            distinfo_dir = std_backend.write_distinfo(
+                Path(metadata_directory), comp_cfg, pkg_info
+            )
+            cmake_cfg = std_backend.get_cmake_config(cfg)
+            std_backend.write_wheel_file(distinfo_dir, cfg, cmake_cfg)
+            return distinfo_dir.name
+        except Exception as e:
+            format_and_rethrow_exception(e, component=True)
+
     def build_wheel(
         self, wheel_directory, config_settings=None, metadata_directory=None
     ):
         """https://www.python.org/dev/peps/pep-0517/#build-wheel"""
         try:
-            assert metadata_directory is None
-
             # Parse options
             self.parse_config_settings(config_settings)
 
+            # Load metadata from the current (component) pyproject.toml file
+            comp_source_dir = Path().resolve()
+            comp_cfg = self.read_all_metadata(
+                comp_source_dir, config_settings, self.verbose
+            )
+            # Load the config from the main pyproject.toml file
+            src_dir = comp_cfg.main_project.resolve()
+            cfg = std_backend.read_config(src_dir, config_settings, self.verbose)
+
             # Build wheel
-            with tempfile.TemporaryDirectory() as tmp_build_dir:
+            keep = self.keep_build_dir
+            with std_backend.temporary_build_dir(
+                comp_source_dir, cfg, keep
+            ) as tmp_build_dir:
                 return self.build_wheel_in_dir(
-                    wheel_directory, tmp_build_dir, config_settings
+                    wheel_directory, tmp_build_dir, config_settings, comp_cfg, cfg
                 )
         except Exception as e:
             format_and_rethrow_exception(e, component=True)
@@ -91,6 +126,7 @@ class _BuildComponentBackend:
         except ValueError as e:
             logger.error("Invalid log level specified", exc_info=e)
         self.runner.verbose = std_backend.is_verbose_enabled(config_settings)
+        self.keep_build_dir = std_backend.is_keep_build_dir_enabled(config_settings)
 
     @staticmethod
     def read_all_metadata(src_dir, config_settings, verbose):
@@ -101,21 +137,14 @@ class _BuildComponentBackend:
     # --- Building wheels -----------------------------------------------------
 
     def build_wheel_in_dir(
-        self, wheel_dir, tmp_build_dir, config_settings, editable=False
+        self, wheel_dir, tmp_build_dir, config_settings, comp_cfg, cfg, editable=False
     ):
         """This is the main function that contains all steps necessary to build
         a complete wheel package, including the CMake builds etc."""
-        comp_source_dir = Path().resolve()
-
-        # Load metadata from the current (component) pyproject.toml file
-        comp_cfg = self.read_all_metadata(
-            comp_source_dir, config_settings, self.verbose
-        )
-
-        # Load the config from the main pyproject.toml file
+        # Load the dynamic metadata from the main project
         src_dir = comp_cfg.main_project.resolve()
         cfg, module = std_backend.read_all_metadata(
-            src_dir, config_settings, self.verbose
+            src_dir, config_settings, self.verbose, cfg
         )
         pkg_info = std_backend.get_pkg_info(comp_cfg, module)
         cmake_cfg = std_backend.get_cmake_config(cfg)
@@ -124,18 +153,12 @@ class _BuildComponentBackend:
         paths = std_backend.get_default_paths(wheel_dir, tmp_build_dir, src_dir, cfg)
 
         # Create dist-info folder
-        distinfo_dir = f"{pkg_info.norm_name}-{pkg_info.version}.dist-info"
-        distinfo_dir = paths.pkg_staging_dir / distinfo_dir
-        distinfo_dir.mkdir(parents=True, exist_ok=True)
-
-        # Write metadata, license and entry points to Wheel's distinfo
-        export_metadata.write_metadata(comp_cfg, distinfo_dir)
-        export_metadata.write_license_files(comp_cfg, distinfo_dir)
-        export_metadata.write_entry_points(comp_cfg, distinfo_dir)
+        std_backend.write_distinfo(paths.pkg_staging_dir, comp_cfg, pkg_info)
 
         # Build and install the CMake project(s)
-        sort_comp = sorted(comp_cfg.component.items(), key=lambda item: int(item[0]))
-        components = {int(key): value for key, value in sort_comp}
+        int_comp = ((int(key), value) for key, value in comp_cfg.component.items())
+        components = dict(sorted(int_comp, key=itemgetter(0)))
+        build_cfg_names = std_backend.get_build_config_names(cfg, components)
         for k, component in components.items():
             if k not in cmake_cfg:
                 msg = f"Index {k} in [tool.py-build-cmake.component] does not "
@@ -143,9 +166,8 @@ class _BuildComponentBackend:
                 msg += "project."
                 raise ConfigError(msg)
             cmkcfg = cmake_cfg[k]
-            build_cfg_name = std_backend.get_build_config_name(cfg, k)
             path = cmkcfg["build_path"]
-            path = str(path).replace("{build_config}", build_cfg_name)
+            path = str(path).replace("{build_config}", build_cfg_names[k])
             build_dir = Path(path)
             cmaker = self.get_cmaker(
                 paths.source_dir,
@@ -203,6 +225,7 @@ _BACKEND = _BuildComponentBackend()
 get_requires_for_build_wheel = _BACKEND.get_requires_for_build_wheel
 get_requires_for_build_sdist = _BACKEND.get_requires_for_build_sdist
 get_requires_for_build_editable = _BACKEND.get_requires_for_build_editable
+prepare_metadata_for_build_wheel = _BACKEND.prepare_metadata_for_build_wheel
 build_wheel = _BACKEND.build_wheel
 build_sdist = _BACKEND.build_sdist
 build_editable = _BACKEND.build_editable
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import contextlib
+import json
 import logging
 import os
 import platform
@@ -7,6 +9,7 @@ import re
 import sys
 import sysconfig
 from dataclasses import dataclass
+from hashlib import sha256
 from itertools import product
 from pathlib import Path
 from string import Template
@@ -16,10 +19,44 @@ from distlib.version import NormalizedVersion  # type: ignore[import-untyped]
 
 from .. import __version__
 from ..common import PackageInfo
+from ..common.util import get_cpu_count
 from .cmd_runner import CommandRunner
 
 logger = logging.getLogger(__name__)
 
+# Environment variables that are read by CMake during the configure step (and
+# stored in the cache), see cmake-env-variables(7). Variables ending in FLAGS or
+# _ROOT and variables starting with CMAKE_ are included as well.
+_CONFIGURE_ENV_VARS = frozenset(
+    {
+        "CC",
+        "CXX",
+        "CUDACXX",
+        "CUDAHOSTCXX",
+        "FC",
+        "OBJC",
+        "OBJCXX",
+        "ASM",
+        "HIPCXX",
+        "ISPC",
+        "SWIFTC",
+        "RC",
+        "PKG_CONFIG_PATH",
+        "PKG_CONFIG_LIBDIR",
+        "MACOSX_DEPLOYMENT_TARGET",
+        "SDKROOT",
+    }
+)
+# Variables starting with CMAKE_ that only affect the build and install steps
+_BUILD_ONLY_ENV_VARS = frozenset(
+    {
+        "CMAKE_BUILD_PARALLEL_LEVEL",
+        "CMAKE_INSTALL_PARALLEL_LEVEL",
+        "CMAKE_INSTALL_MODE",
+        "CMAKE_NO_VERBOSE",
+    }
+)
+
 
 @dataclass
 class CMakeSettings:
@@ -49,6 +86,8 @@ class CMakeConfigureSettings:
     python_library: Path | None
     python_include_dir: Path | None
     python_interpreter_id: str | None
+    compiler_launcher: Path | None = None
+    incremental: bool = False
 
 
 @dataclass
@@ -92,6 +131,9 @@ class CMaker:
         self.package_info = package_info
         self.runner = runner
         self.environment: dict[str, str] | None = None
+        # Number of CMake projects that are built at the same time, which share
+        # the available CPU cores
+        self.concurrent_builds: int = 1
 
     def run(self, *args, **kwargs):
         return self.runner.run(*args, **kwargs)
@@ -102,6 +144,10 @@ class CMaker:
         if self.environment is None:
             pbc = "PY_BUILD_CMAKE"
             self.environment = os.environ.copy()
+            # Build in parallel by default; explicit --parallel arguments or
+            # the user's own CMAKE_BUILD_PARALLEL_LEVEL take precedence
+            jobs = max(1, get_cpu_count() // self.concurrent_builds)
+            self.environment.setdefault("CMAKE_BUILD_PARALLEL_LEVEL", str(jobs))
             self.environment[f"{pbc}_VERSION"] = str(__version__)
             self.environment[f"{pbc}_PROJECT_VERSION"] = self.package_info.version
             self.environment[f"{pbc}_PACKAGE_VERSION"] = self.package_info.version
@@ -110,6 +156,11 @@ class CMaker:
             self.environment[f"{pbc}_IMPORT_NAME"] = self.package_info.module_name
             self.environment[f"{pbc}_MODULE_NAME"] = self.package_info.module_name
             self.environment[f"{pbc}_BINARY_DIR"] = str(self.cmake_settings.build_path)
+            # Make the ccache hashes independent of the project's location
+            launcher = self.conf_settings.compiler_launcher
+            if launcher is not None and launcher.stem == "ccache":
+                working_dir = str(self.cmake_settings.working_dir)
+                self.environment.setdefault("CCACHE_BASEDIR", working_dir)
             if self.install_settings.prefix is not None:
                 install_prefix = str(self.install_settings.prefix)
                 self.environment[f"{pbc}_INSTALL_PREFIX"] = install_prefix
@@ -284,6 +335,16 @@ class CMaker:
             return [opt]
         return []
 
+    def get_configure_options_launcher(self) -> list[Option]:
+        """Sets CMAKE_<LANG>_COMPILER_LAUNCHER."""
+        launcher = self.conf_settings.compiler_launcher
+        if not launcher:
+            return []
+        return [
+            Option(f"CMAKE_{lang}_COMPILER_LAUNCHER", launcher.as_posix(), "FILEPATH")
+            for lang in ("C", "CXX", "CUDA")
+        ]
+
     def get_configure_options_toolchain(self) -> list[str]:
         """Sets CMAKE_TOOLCHAIN_FILE."""
         return (
@@ -308,6 +369,7 @@ class CMaker:
         return (
             self.get_configure_options_package()
             + self.get_configure_options_make()
+            + self.get_configure_options_launcher()
             + self.get_configure_options_python()
             + self.get_configure_options_install()
         )
@@ -373,11 +435,102 @@ class CMaker:
         cwd = self.cmake_settings.working_dir
         return str(cwd) if cwd is not None else None
 
+    def get_configure_fingerprint_file(self) -> Path:
+        return self.cmake_settings.build_path / "py-build-cmake-configure.sha256"
+
+    def get_configure_environment(self) -> dict[str, str]:
+        """Subset of the environment that affects the configure step, such as
+        the compilers and their flags."""
+
+        def is_relevant(k: str):
+            if k in _CONFIGURE_ENV_VARS:
+                return True
+            if k.startswith("CMAKE_"):
+                return k not in _BUILD_ONLY_ENV_VARS
+            return k.endswith(("FLAGS", "_ROOT"))
+
+        env = self.prepare_environment()
+        return {k: v for k, v in env.items() if is_relevant(k)}
+
+    def get_configure_input_files(self) -> list[Path]:
+        """Files that are read by CMake during the configure step, but that are
+        not tracked by the generated build system: the toolchain file, and the
+        presets files if a preset is used. Files included by these files are
+        not taken into account."""
+        files = []
+        if self.conf_settings.toolchain_file:
+            files.append(Path(self.conf_settings.toolchain_file))
+        if self.conf_settings.preset:
+            source = self.cmake_settings.source_path
+            files += [source / "CMakePresets.json", source / "CMakeUserPresets.json"]
+        cwd = self.cmake_settings.working_dir
+        return [f if cwd is None else Path(cwd) / f for f in files]
+
+    @staticmethod
+    def hash_file(path: Path) -> str | None:
+        try:
+            return sha256(path.read_bytes()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+    def get_configure_fingerprint(self) -> str:
+        """Hash of all inputs of the configure step, except for the (temporary)
+        installation prefix, which changes for every build. The path to the
+        Python interpreter is included: CMake caches it, so the configure step
+        must be repeated if it changes (e.g. for a new isolated environment).
+        For the toolchain and presets files, their contents are included as
+        well."""
+        skip = {"CMAKE_INSTALL_PREFIX"}
+        preload = self.get_preload_options()
+        data = {
+            "version": str(__version__),
+            "command": str(self.cmake_settings.command),
+            "source": str(self.cmake_settings.source_path),
+            "build": str(self.cmake_settings.build_path),
+            "preset": self.conf_settings.preset,
+            "generator": self.conf_settings.generator,
+            "platform": self.get_cmake_generator_platform(),
+            "preload": [
+                (o.name, o.value, o.type) for o in preload if o.name not in skip
+            ],
+            "options": self.get_configure_options(),
+            "args": self.conf_settings.args,
+            "environment": self.conf_settings.environment,
+            "configure_environment": self.get_configure_environment(),
+            "files": {
+                str(f): self.hash_file(f) for f in self.get_configure_input_files()
+            },
+        }
+        return sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def is_configure_up_to_date(self) -> bool:
+        """Check whether the build directory was configured before, with the
+        same inputs as the current configuration."""
+        cache_file = self.cmake_settings.build_path / "CMakeCache.txt"
+        fingerprint_file = self.get_configure_fingerprint_file()
+        if not cache_file.is_file() or not fingerprint_file.is_file():
+            return False
+        fingerprint = fingerprint_file.read_text(encoding="utf-8").strip()
+        return fingerprint == self.get_configure_fingerprint()
+
     def configure(self):
+        if self.conf_settings.incremental and self.is_configure_up_to_date():
+            logger.info(
+                "Skipping CMake configure step, %s is up to date",
+                self.cmake_settings.build_path,
+            )
+            return
         env = self.prepare_environment()
         cmd = self.get_configure_command()
         cwd = self.get_working_dir()
+        fingerprint_file = self.get_configure_fingerprint_file()
+        if not self.runner.dry:
+            with contextlib.suppress(FileNotFoundError):
+                fingerprint_file.unlink()
         self.run(cmd, cwd=cwd, check=True, env=env)
+        if not self.runner.dry:
+            fingerprint = self.get_configure_fingerprint()
+            fingerprint_file.write_text(fingerprint + "\n", encoding="utf-8")
 
     def get_build_command(self, config, preset):
         cmd = [str(self.cmake_settings.command), "--build"]
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import re
 import sys
+import threading
 from pprint import pprint
-from subprocess import CalledProcessError
+from subprocess import PIPE, STDOUT, CalledProcessError, CompletedProcess, Popen
 from subprocess import run as sp_run
 
 from distlib.version import NormalizedVersion  # type: ignore[import-untyped]
@@ -25,9 +26,12 @@ class CommandRunner:
 
             print(join(args[0]))
         if not self.dry:
-            return sp_run(*args, **kwargs)  # noqa: PLW1510
+            return self.run_subprocess(*args, **kwargs)
         return None
 
+    def run_subprocess(self, *args, **kwargs):
+        return sp_run(*args, **kwargs)  # noqa: PLW1510
+
     def check_program_version(
         self,
         program: str,
@@ -71,3 +75,51 @@ class CommandRunner:
                 print(f"{type(e).__module__}.{type(e).__name__}", e, sep=": ")
             return False
         return True
+
+
+class PrefixedCommandRunner(CommandRunner):
+    """Command runner that prefixes each line of output of the commands it runs,
+    so the output of commands that run concurrently can be told apart. The
+    running command can be stopped from another thread using cancel()."""
+
+    output_lock = threading.Lock()
+
+    def __init__(self, prefix: str, verbose: bool = False, dry: bool = False):
+        super().__init__(verbose=verbose, dry=dry)
+        self.prefix = prefix
+        self.cancelled = False
+        self.process: Popen | None = None
+        self.process_lock = threading.Lock()
+
+    def cancel(self):
+        """Terminate the command that is currently running, and refuse to start
+        any new ones."""
+        with self.process_lock:
+            self.cancelled = True
+            if self.process is not None:
+                self.process.terminate()
+
+    def run_subprocess(self, *args, **kwargs):
+        # Commands whose output is captured by the caller are not relayed
+        if "stdout" in kwargs or kwargs.get("capture_output"):
+            return super().run_subprocess(*args, **kwargs)
+        check = kwargs.pop("check", False)
+        kwargs.update(stdout=PIPE, stderr=STDOUT, text=True, errors="replace")
+        with self.process_lock:
+            if self.cancelled:
+                msg = f"{self.prefix}: cancelled"
+                raise RuntimeError(msg)
+            self.process = proc = Popen(*args, **kwargs)
+        try:
+            with proc:
+                assert proc.stdout is not None
+                for line in proc.stdout:
+                    with self.output_lock:
+                        sys.stdout.write(f"[{self.prefix}] {line}")
+                        sys.stdout.flush()
+        finally:
+            with self.process_lock:
+                self.process = None
+        if check and proc.returncode != 0:
+            raise CalledProcessError(proc.returncode, proc.args)
+        return CompletedProcess(proc.args, proc.returncode)
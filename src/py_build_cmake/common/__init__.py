@@ -72,17 +72,15 @@ class Module:
             # Generated modules/packages don't exist in the source directory
             return
 
-        def _include(s: str | Path):
-            p = Path(s)
-            return p.name != "__pycache__" and not p.name.endswith(".pyc")
+        def _include(name: str):
+            return name != "__pycache__" and not name.endswith(".pyc")
 
         if self.is_package:
             # Ensure we sort all files and directories so the order is stable
             for dirpath, dirs, files in os.walk(str(self.full_path)):
-                for file in sorted(files):
-                    filepath = Path(dirpath) / file
-                    if _include(filepath):
-                        yield filepath
+                dirpath_ = Path(dirpath)
+                for file in sorted(filter(_include, files)):
+                    yield dirpath_ / file
                 dirs[:] = filter(_include, sorted(dirs))
         else:
             yield self.full_file
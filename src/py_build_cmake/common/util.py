@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
 import platform
 import re
 import sys
+from functools import lru_cache
 from typing import Sequence, cast
 
 if sys.version_info < (3, 8):
@@ -13,6 +15,7 @@ else:
     OSIdentifier = Literal["linux", "windows", "mac"]
 
 
+@lru_cache(maxsize=None)
 def get_os_name() -> OSIdentifier:
     """Get the name of the current platform."""
     osname = {
@@ -26,6 +29,14 @@ def get_os_name() -> OSIdentifier:
     return cast(OSIdentifier, osname)
 
 
+def get_cpu_count() -> int:
+    """Number of CPUs available to the current process."""
+    sched_getaffinity = getattr(os, "sched_getaffinity", None)
+    if sched_getaffinity is not None:
+        return len(sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 def normalize_name_wheel_pep_427(name: str) -> str:
     """https://www.python.org/dev/peps/pep-0427/#escaping-and-unicode"""
     return re.sub(r"[^\w\d.]+", "_", name, flags=re.UNICODE)
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, cast
 
 from lark import Lark, Token, Transformer, v_args
 
-grammar = Path(__file__).with_suffix(".lark").read_text()
-
 
 @dataclass
 class CLIOption:
@@ -41,13 +40,17 @@ class TreeToCLIOption(Transformer):
     FALSE = lambda self, _: False
 
 
-cli_parser = Lark(grammar, start="option", parser="lalr", transformer=TreeToCLIOption())
-file_parser = Lark(grammar, start="lines", parser="lalr", transformer=TreeToCLIOption())
+@lru_cache(maxsize=None)
+def get_parser(start: str) -> Lark:
+    """Constructing the parsers is relatively expensive, so only do it when
+    there are actually options to parse."""
+    grammar = Path(__file__).with_suffix(".lark").read_text()
+    return Lark(grammar, start=start, parser="lalr", transformer=TreeToCLIOption())
 
 
 def parse_cli(s: str) -> CLIOption:
-    return cast(CLIOption, cli_parser.parse(s))
+    return cast(CLIOption, get_parser("option").parse(s))
 
 
 def parse_file(s: str) -> list[CLIOption]:
-    return cast(List[CLIOption], file_parser.parse(s))
+    return cast(List[CLIOption], get_parser("lines").parse(s))
@@ -213,6 +213,22 @@ def add_cli_override(
     return overrides
 
 
+def get_sdist_cfg(v: ValueReference) -> dict[str, Any]:
+    """Extract the sdist options for one platform from the value reference."""
+    sdist_cfg = {
+        clude + "_patterns": v.get_value(ConfPath(("sdist", clude)))
+        for clude in ("include", "exclude")
+    }
+    level_path = ConfPath(("sdist", "compression_level"))
+    if v.is_value_set(level_path):
+        level = v.get_value(level_path)
+        if not 0 <= level <= 9:
+            msg = f"Invalid sdist compression_level {level}: should be 0-9"
+            raise ConfigError(msg)
+        sdist_cfg["compression_level"] = level
+    return sdist_cfg
+
+
 def process_config(
     pyproject_path: Path | PurePosixPath,
     config_files: dict[str, dict[str, Any]],
@@ -278,14 +294,8 @@ def process_config(
     }
 
     # Store the sdist folders (this is based on flit)
-    def get_sdist_cludes(v: ValueReference) -> dict[str, Any]:
-        return {
-            clude + "_patterns": v.get_value(ConfPath(("sdist", clude)))
-            for clude in ("include", "exclude")
-        }
-
     cfg.sdist = {
-        os: get_sdist_cludes(pbc_value_ref.sub_ref(os))
+        os: get_sdist_cfg(pbc_value_ref.sub_ref(os))
         for os in ("linux", "windows", "mac", "cross")
         if pbc_value_ref.is_value_set(os)
     }
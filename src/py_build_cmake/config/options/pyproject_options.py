@@ -125,6 +125,12 @@ def get_options(project_path: Path | PurePosixPath, *, test: bool = False):
                                 "distribution. May include the '*' wildcard "
                                 "or '**' for recursive patterns.",
                                 default=DefaultValueValue([])),
+        IntConfigOption("compression_level",
+                        "Gzip compression level (0-9) for the source "
+                        "distribution. Lower levels are faster, at the cost "
+                        "of larger files.",
+                        "compression_level = 1",
+                        default=NoDefaultValue("9")),
     ])  # fmt: skip
 
     # [tool.py-build-cmake.cmake]
@@ -175,6 +181,16 @@ def get_options(project_path: Path | PurePosixPath, *, test: bool = False):
                            "available in the system PATH, it will be installed "
                            "automatically as a build dependency.",
                            "generator = \"Ninja Multi-Config\""),
+        StringConfigOption("compiler_launcher",
+                           "Program used to launch the C, C++ and CUDA "
+                           "compilers, passed to the configuration step as "
+                           "`CMAKE_<LANG>_COMPILER_LAUNCHER`. Useful for "
+                           "compiler caches, which speed up repeated builds "
+                           "for different Python versions.\n"
+                           "The special value `auto` selects `ccache` or "
+                           "`sccache` if one of them is available in the "
+                           "system PATH.",
+                           "compiler_launcher = \"auto\""),
         PathConfigOption("source_path",
                          "Folder containing CMakeLists.txt.",
                          default=DefaultValueValue("."),
@@ -386,6 +402,16 @@ def get_options(project_path: Path | PurePosixPath, *, test: bool = False):
                            "#file-name-convention",
                            "build_tag = '1'",
                            default=NoDefaultValue()),
+        EnumConfigOption("compression",
+                         "Compression method for the files in the Wheel "
+                         "package. Using `stored` (no compression) speeds up "
+                         "the creation of large Wheel packages during "
+                         "development, at the cost of larger files.\n"
+                         "Has no effect if `SOURCE_DATE_EPOCH` is set: "
+                         "reproducible Wheels are always stored uncompressed.",
+                         "compression = 'stored'",
+                         default=NoDefaultValue("deflated"),
+                         options=["deflated", "stored"]),
     ])  # fmt: skip
     # [tool.py-build-cmake.stubgen]
     stubgen = pbc.insert(
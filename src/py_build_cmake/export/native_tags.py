@@ -12,6 +12,7 @@ import platform
 import re
 import sys
 import sysconfig
+from functools import lru_cache
 from importlib.machinery import EXTENSION_SUFFIXES
 from typing import Dict, List, Mapping
 
@@ -156,10 +157,15 @@ def guess_platform_tag(env=None) -> str:
 WheelTags = Dict[str, List[str]]
 
 
+@lru_cache(maxsize=None)
+def _get_native_tags_cached(guess: bool) -> tuple[str, str, str]:
+    # The tags don't change during the lifetime of the process, and they are
+    # requested multiple times per build.
+    arch = guess_platform_tag() if guess else get_platform_tag()
+    return get_python_tag(), get_abi_tag(), arch
+
+
 def get_native_tags(guess=False) -> WheelTags:
     """Get the PEP 425 tags for the current platform."""
-    return {
-        "pyver": [get_python_tag()],
-        "abi": [get_abi_tag()],
-        "arch": [guess_platform_tag() if guess else get_platform_tag()],
-    }
+    pyver, abi, arch = _get_native_tags_cached(bool(guess))
+    return {"pyver": [pyver], "abi": [abi], "arch": [arch]}
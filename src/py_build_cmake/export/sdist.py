@@ -127,6 +127,8 @@ class SdistBuilder:
     which is what should normally be published to PyPI.
     """
 
+    compresslevel: int = 9
+
     def __init__(
         self,
         module: Module,
@@ -206,7 +208,9 @@ class SdistBuilder:
         target = target_dir / (self.dir_name + ".tar.gz")
         source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH", "")
         mtime = int(source_date_epoch) if source_date_epoch else None
-        gz = GzipFile(str(target), mode="wb", mtime=mtime)
+        gz = GzipFile(
+            str(target), mode="wb", compresslevel=self.compresslevel, mtime=mtime
+        )
         tf = tarfile.TarFile(
             str(target), mode="w", fileobj=gz, format=tarfile.PAX_FORMAT
         )
@@ -6,6 +6,9 @@ from typing import Any
 
 from .native_tags import WheelTags, get_native_tags
 
+# Matches CPython Python and ABI tags (e.g. cp312), capturing the version
+_CPYTHON_TAG_RE = re.compile(r"cp(\d+)")
+
 
 def get_cross_tags(crosscfg: dict[str, Any]) -> WheelTags:
     """Get the PEP 425 tags to use when cross-compiling."""
@@ -28,7 +31,7 @@ def convert_abi_tag(abi_tag: str, wheel_cfg: dict) -> str:
         return "none"
     elif wheel_cfg["python_abi"] == "abi3":
         # Only use abi3 if we're actually building for CPython
-        m = re.match(r"^cp(\d+).*$", abi_tag)
+        m = _CPYTHON_TAG_RE.match(abi_tag)
         if m and int(m[1]) >= wheel_cfg["abi3_minimum_cpython_version"]:
             return "abi3"
         return abi_tag
@@ -43,7 +46,7 @@ def convert_pyver_tag(pyver_tag: str, wheel_cfg: dict) -> str:
     if wheel_cfg["python_abi"] == "abi3":
         # Only use abi3 if we're actually building for CPython
         min_cpython_version = wheel_cfg["abi3_minimum_cpython_version"]
-        m = re.match(r"^cp(\d+).*$", pyver_tag)
+        m = _CPYTHON_TAG_RE.match(pyver_tag)
         if m and int(m[1]) >= min_cpython_version:
             return f"cp{min_cpython_version}"
     # By default, we don't change anything if ABI3 is not available or if this
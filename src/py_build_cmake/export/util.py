@@ -1,18 +1,149 @@
 from __future__ import annotations
 
+import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict
 
 from ..common import Module
 
+logger = logging.getLogger(__name__)
+
 
 def copy_pkg_source_to(staging_dir: Path, module: Module, symlink: bool = False):
     """Copy the files of a Python package to the build directory."""
-    for src in module.iter_files_abs():
-        rel_path = src.relative_to(module.prefix)
-        dst = staging_dir / rel_path
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        if symlink:
+    files = [
+        (src, staging_dir / src.relative_to(module.prefix))
+        for src in module.iter_files_abs()
+    ]
+    for parent in {dst.parent for _, dst in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    if symlink:
+        for src, dst in files:
             dst.symlink_to(src, target_is_directory=False)
-        else:
-            shutil.copy2(src, dst, follow_symlinks=False)
+    else:
+        # Copying is I/O-bound, so multiple files can be copied concurrently
+        copy = lambda f: shutil.copy2(*f, follow_symlinks=False)
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(copy, files))
+
+
+def move_path(src_path: Path, dest_path: Path):
+    """Move a file or directory. Uses a simple rename if possible (i.e. if
+    both paths are on the same file system), falling back to a copy."""
+    try:
+        src_path.replace(dest_path)
+    except OSError:
+        shutil.move(str(src_path), str(dest_path))
+
+
+# Cache of the contents of the destination directories, mapping the names of
+# their entries to whether they are directories.
+_DirListings = Dict[Path, Dict[str, bool]]
+
+
+def _list_dir(listings: _DirListings, path: Path) -> dict[str, bool]:
+    listing = listings.get(path)
+    if listing is None:
+        try:
+            with os.scandir(path) as it:
+                listing = {e.name: e.is_dir() for e in it}
+        except OSError:
+            listing = {}
+        listings[path] = listing
+    return listing
+
+
+def _stubs_already_exist(listings: _DirListings, dest_dir: Path, f: str):
+    # We don't want to replace existing .pyi files.
+    listing = _list_dir(listings, dest_dir)
+    if f in listing:
+        return True
+    # If a directory with the same name already exists, we only want to copy
+    # our .pyi file if the directory does not contain an __init__.pyi file.
+    name = f[: -len(".pyi")]
+    if not listing.get(name, False):
+        return False
+    return "__init__.pyi" in _list_dir(listings, dest_dir / name)
+
+
+def _move_stub_file(
+    listings: _DirListings, src_dir: Path, dest_dir: Path, rel_dir: Path, f: str
+):
+    src_path = src_dir / f
+    dest_path = dest_dir / f
+    if not _stubs_already_exist(listings, dest_dir, f):
+        logger.debug("Copying generated stub  %s -> %s", src_path, dest_path)
+        move_path(src_path, dest_path)
+        _list_dir(listings, dest_dir)[f] = False
+    else:
+        logger.info(
+            "Not copying generated stub file %s because a .pyi "
+            "file for the same module already exists",
+            rel_dir / f,
+        )
+
+
+def _move_stub_dir(
+    listings: _DirListings, src_dir: Path, dest_dir: Path, rel_dir: Path, d: str
+) -> bool:
+    """Move a directory of stubs to the destination if possible. Returns true
+    if its contents should be handled recursively instead."""
+    src_path = src_dir / d
+    dest_path = dest_dir / d
+    listing = _list_dir(listings, dest_dir)
+    # If the destination already has stubs for this (sub)module in a .pyi file,
+    # adding the folder as well would only cause confusion. Ignore the new
+    # folder and keep the existing .pyi file. Don't recurse into the folder
+    # either.
+    if d + ".pyi" in listing:
+        logger.info(
+            "Not copying generated stub directory %s because a "
+            ".pyi file for the same module already exists",
+            rel_dir / d,
+        )
+        return False
+    # If there's already a folder with the same name, simply recurse into it.
+    if d in listing:
+        if listing[d]:
+            return True
+        logger.debug(
+            "Not copying generated stub directory %s because a "
+            "file with the same name already exists",
+            rel_dir / d,
+        )
+        return False
+    # If there's neither a .pyi file nor a folder with the same name, we can
+    # safely move our folder to the destination, and there's no need to
+    # recurse any further.
+    logger.debug("Copying generated stubs %s -> %s", src_path, dest_path)
+    move_path(src_path, dest_path)
+    listing[d] = True
+    return False
+
+
+def move_stubs_to(staging_dir: Path, stubs_dir: Path):
+    """Move the generated stubs (.pyi) to the build directory, without
+    overwriting any existing stubs."""
+    listings: _DirListings = {}
+    # Depth-first traversal of the generated stubs, handling the files in each
+    # directory before its subdirectories.
+    stack = [(stubs_dir, staging_dir, Path())]
+    while stack:
+        src_dir, dest_dir, rel_dir = stack.pop()
+        try:
+            with os.scandir(src_dir) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for e in entries:
+            if e.name.endswith(".pyi") and not e.is_dir():
+                _move_stub_file(listings, src_dir, dest_dir, rel_dir, e.name)
+        for e in entries:
+            if e.is_dir() and _move_stub_dir(
+                listings, src_dir, dest_dir, rel_dir, e.name
+            ):
+                name = e.name
+                stack.append((src_dir / name, dest_dir / name, rel_dir / name))
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 import logging
+import mmap
 import os
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
 
 from distlib.wheel import Wheel  # type: ignore[import-untyped]
 
+from .. import __version__
+
 logger = logging.getLogger(__name__)
 
 
 class WheelBuilder(Wheel):
+    compression: int = zipfile.ZIP_DEFLATED
+    mmap_threshold: int = 64 * 1024
+
     def _get_source_time(self):
         """
         Get the value of the SOURCE_DATE_EPOCH in a format to pass to ZipInfo.
@@ -28,14 +36,83 @@ class WheelBuilder(Wheel):
             return None
         return time.gmtime(max(315532800, filetime))
 
+    @staticmethod
+    def write_wheel_file(
+        distinfo_dir: Path,
+        root_is_purelib: bool,
+        tags: Iterable[tuple[str, str, str]],
+        wheel_version=(1, 0),
+    ):
+        """
+        Write the WHEEL file to the given dist-info folder. This is used both
+        when building the Wheel and by prepare_metadata_for_build_wheel, so
+        the two always agree.
+        """
+        wheel_metadata = [
+            "Wheel-Version: {}.{}".format(*wheel_version),
+            f"Generator: py-build-cmake {__version__}",
+            f"Root-Is-Purelib: {str(root_is_purelib).lower()}",
+        ]
+        for pyver, abi, arch in tags:
+            wheel_metadata.append(f"Tag: {pyver}-{abi}-{arch}")
+        with (distinfo_dir / "WHEEL").open("w", encoding="utf-8") as f:
+            f.write("\n".join(wheel_metadata))
+
+    def build(self, paths, tags=None, wheel_version=None):
+        """
+        Same as distlib's implementation, but remembers the options that are
+        needed by write_wheel_file.
+        """
+        self.root_is_purelib = "platlib" not in paths
+        if wheel_version is not None:
+            self.wheel_version = wheel_version
+        return super().build(paths, tags, wheel_version)
+
+    def write_records(self, info, libdir, archive_paths):
+        """
+        Same as distlib's implementation, but writes the WHEEL file using
+        write_wheel_file, and hashes the files concurrently (hashlib releases
+        the GIL).
+        """
+        distinfo, info_dir = info
+        # distlib's build method has already written a WHEEL file at this point
+        # (and added it to archive_paths), replace it by our own before hashing
+        self.write_wheel_file(
+            Path(distinfo), self.root_is_purelib, self.tags, self.wheel_version
+        )
+
+        def get_record(entry: tuple[str, str]):
+            ap, p = entry
+            with Path(p).open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                # Hash large files (e.g. extension modules) directly from the
+                # page cache instead of copying them into memory first
+                if size < self.mmap_threshold:
+                    hash_kind, digest = self.get_hash(f.read())
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hash_kind, digest = self.get_hash(mm)
+            return ap, f"{hash_kind}={digest}", size
+
+        with ThreadPoolExecutor() as pool:
+            records = list(pool.map(get_record, archive_paths))
+        p = str(Path(distinfo) / "RECORD")
+        ap = f"{info_dir}/RECORD"
+        self.write_record(records, p, ap)
+        archive_paths.append((ap, p))
+
     def build_zip(self, pathname: str | Path, archive_paths: list[tuple[str, str]]):
         """
         We override this method to ensure a consistent modification time for all
-        files in the ZIP if the SOURCE_DATE_EPOCH environment variable is set.
+        files in the ZIP if the SOURCE_DATE_EPOCH environment variable is set,
+        and to allow selecting the compression method.
         """
         filetime = self._get_source_time()
         if filetime is None:
-            super().build_zip(pathname, archive_paths)
+            with zipfile.ZipFile(pathname, "w", self.compression) as zf:
+                for ap, p in archive_paths:
+                    zf.write(p, ap)
+                    logger.debug("Wrote %s to %s in wheel", p, ap)
             return
         tmstr = time.strftime("%Y-%m-%dT%H:%M:%S", filetime)
         msg = f"SOURCE_DATE_EPOCH is set, using mtime={tmstr} for files in Wheel"
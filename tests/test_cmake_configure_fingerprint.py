@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from py_build_cmake.commands.cmake import (
+    CMakeBuildSettings,
+    CMakeConfigureSettings,
+    CMakeInstallSettings,
+    CMaker,
+    CMakeSettings,
+)
+from py_build_cmake.commands.cmd_runner import CommandRunner
+from py_build_cmake.common import PackageInfo
+
+
+def get_cmaker(
+    build_path: Path,
+    options: dict,
+    prefix: str = "staging",
+    toolchain_file: Path | None = None,
+    preset: str | None = None,
+):
+    return CMaker(
+        cmake_settings=CMakeSettings(
+            working_dir=build_path.parent,
+            source_path=Path("."),
+            build_path=build_path,
+            os="linux",
+            find_python=False,
+            find_python3=True,
+            minimum_required="3.17",
+            generator_platform=None,
+        ),
+        conf_settings=CMakeConfigureSettings(
+            environment={},
+            build_type="Release",
+            options=options,
+            args=[],
+            preset=preset,
+            generator="Ninja",
+            make_program=None,
+            cross_compiling=False,
+            toolchain_file=toolchain_file,
+            python_prefix=None,
+            python_library=None,
+            python_include_dir=None,
+            python_interpreter_id=None,
+            incremental=True,
+        ),
+        build_settings=CMakeBuildSettings([], [], [], []),
+        install_settings=CMakeInstallSettings(
+            args=[], configs=[], components=[], prefix=build_path.parent / prefix
+        ),
+        package_info=PackageInfo(
+            version="1.2.3", package_name="foobar", module_name="foobar"
+        ),
+        runner=CommandRunner(),
+    )
+
+
+@pytest.fixture()
+def configured(tmp_path, monkeypatch):
+    """Build directory that was configured with CFLAGS=-O2 and FOO=bar."""
+    monkeypatch.setenv("CFLAGS", "-O2")
+    build_path = tmp_path / "build"
+    build_path.mkdir()
+    (build_path / "CMakeCache.txt").touch()
+    cmaker = get_cmaker(build_path, {"FOO": "bar"})
+    fingerprint = cmaker.get_configure_fingerprint()
+    cmaker.get_configure_fingerprint_file().write_text(fingerprint + "\n")
+    return build_path
+
+
+def test_configure_up_to_date(configured):
+    assert get_cmaker(configured, {"FOO": "bar"}).is_configure_up_to_date()
+
+
+def test_configure_fingerprint_options(configured):
+    assert not get_cmaker(configured, {"FOO": "baz"}).is_configure_up_to_date()
+    assert not get_cmaker(configured, {}).is_configure_up_to_date()
+
+
+def test_configure_fingerprint_install_prefix(configured):
+    # The temporary installation prefix is different for every build
+    cmaker = get_cmaker(configured, {"FOO": "bar"}, prefix="other-staging")
+    assert cmaker.is_configure_up_to_date()
+
+
+def test_configure_fingerprint_environment(configured, monkeypatch):
+    # Irrelevant environment variables do not cause a reconfigure
+    monkeypatch.setenv("PY_BUILD_CMAKE_TEST_UNRELATED", "1")
+    assert get_cmaker(configured, {"FOO": "bar"}).is_configure_up_to_date()
+    monkeypatch.setenv("CFLAGS", "-O3")
+    assert not get_cmaker(configured, {"FOO": "bar"}).is_configure_up_to_date()
+
+
+def test_configure_without_cache(configured):
+    (configured / "CMakeCache.txt").unlink()
+    assert not get_cmaker(configured, {"FOO": "bar"}).is_configure_up_to_date()
+
+
+def test_configure_fingerprint_toolchain_file(configured):
+    toolchain_file = configured.parent / "toolchain.cmake"
+    toolchain_file.write_text("set(CMAKE_SYSTEM_NAME Linux)\n")
+    cmaker = get_cmaker(configured, {"FOO": "bar"}, toolchain_file=toolchain_file)
+    fingerprint = cmaker.get_configure_fingerprint()
+    assert cmaker.get_configure_fingerprint() == fingerprint
+    toolchain_file.write_text("set(CMAKE_SYSTEM_NAME Windows)\n")
+    assert cmaker.get_configure_fingerprint() != fingerprint
+
+
+def test_configure_fingerprint_presets(configured):
+    # The presets files are looked up in the source directory
+    presets_file = configured.parent / "CMakePresets.json"
+    presets_file.write_text('{"version": 3}\n')
+    cmaker = get_cmaker(configured, {"FOO": "bar"}, preset="default")
+    fingerprint = cmaker.get_configure_fingerprint()
+    (configured.parent / "CMakeUserPresets.json").write_text('{"version": 3}\n')
+    assert cmaker.get_configure_fingerprint() != fingerprint
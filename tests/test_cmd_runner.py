@@ -0,0 +1,66 @@
+import sys
+import threading
+import time
+from pathlib import Path
+from subprocess import CalledProcessError
+from types import SimpleNamespace
+
+import pytest
+
+from py_build_cmake.build import _BuildBackend
+from py_build_cmake.commands.cmd_runner import CommandRunner, PrefixedCommandRunner
+
+
+def test_prefixed_output(capfd):
+    runner = PrefixedCommandRunner("cfg-1")
+    cmd = [sys.executable, "-c", "print('foo'); print('bar')"]
+    res = runner.run(cmd, check=True)
+    assert res.returncode == 0
+    out, _ = capfd.readouterr()
+    assert out.splitlines() == ["[cfg-1] foo", "[cfg-1] bar"]
+
+
+def test_prefixed_check():
+    runner = PrefixedCommandRunner("cfg-1")
+    cmd = [sys.executable, "-c", "raise SystemExit(3)"]
+    with pytest.raises(CalledProcessError):
+        runner.run(cmd, check=True)
+    assert runner.run(cmd).returncode == 3
+
+
+def test_prefixed_cancel():
+    runner = PrefixedCommandRunner("cfg-1")
+    cmd = [sys.executable, "-c", "import time; print('go', flush=True); time.sleep(60)"]
+    timer = threading.Timer(0.5, runner.cancel)
+    timer.start()
+    start = time.monotonic()
+    with pytest.raises(CalledProcessError):
+        runner.run(cmd, check=True)
+    assert time.monotonic() - start < 30
+    # No new commands are started after cancellation
+    with pytest.raises(RuntimeError, match="cancelled"):
+        runner.run([sys.executable, "-c", "pass"])
+
+
+class FakeCMaker:
+    def __init__(self, name, script):
+        self.cmake_settings = SimpleNamespace(build_path=Path("build") / name)
+        self.runner = CommandRunner()
+        self.script = script
+
+    def configure(self):
+        self.runner.run([sys.executable, "-c", self.script], check=True)
+
+    def build(self):
+        pass
+
+
+def test_concurrent_build_stops_on_failure():
+    slow = FakeCMaker("slow", "import time; time.sleep(60)")
+    failing = FakeCMaker("failing", "raise SystemExit(1)")
+    shared_runner = slow.runner
+    start = time.monotonic()
+    with pytest.raises(CalledProcessError):
+        _BuildBackend.configure_and_build_concurrently([slow, failing])
+    assert time.monotonic() - start < 30
+    assert slow.runner is shared_runner
@@ -410,6 +410,106 @@ def test_real_config_no_cmake():
     assert conf.cross is None
 
 
+def test_real_config_sdist_compression_level():
+    pyproj_path = PurePosixPath("/project/pyproject.toml")
+    pyproj = {
+        "project": {"name": "foobar", "version": "1.2.3", "description": "descr"},
+        "tool": {
+            "py-build-cmake": {
+                "sdist": {"compression_level": 1},
+                "mac": {"sdist": {"compression_level": 6}},
+            }
+        },
+    }
+    files = {"pyproject.toml": pyproj}
+    conf = process_config(pyproj_path, files, {}, test=True)
+    assert conf.sdist == {
+        "linux": {
+            "include_patterns": [],
+            "exclude_patterns": [],
+            "compression_level": 1,
+        },
+        "windows": {
+            "include_patterns": [],
+            "exclude_patterns": [],
+            "compression_level": 1,
+        },
+        "mac": {
+            "include_patterns": [],
+            "exclude_patterns": [],
+            "compression_level": 6,
+        },
+    }
+
+
+def test_real_config_sdist_compression_level_invalid():
+    pyproj_path = PurePosixPath("/project/pyproject.toml")
+    pyproj = {
+        "project": {"name": "foobar", "version": "1.2.3", "description": "descr"},
+        "tool": {"py-build-cmake": {"sdist": {"compression_level": 10}}},
+    }
+    files = {"pyproject.toml": pyproj}
+    with pytest.raises(ConfigError, match="compression_level"):
+        process_config(pyproj_path, files, {}, test=True)
+
+
+def test_real_config_wheel_compression():
+    pyproj_path = PurePosixPath("/project/pyproject.toml")
+    pyproj = {
+        "project": {"name": "foobar", "version": "1.2.3", "description": "descr"},
+        "tool": {"py-build-cmake": {"linux": {"wheel": {"compression": "stored"}}}},
+    }
+    files = {"pyproject.toml": pyproj}
+    conf = process_config(pyproj_path, files, {}, test=True)
+    # Deflated by default
+    assert "compression" not in conf.wheel["windows"]
+    assert "compression" not in conf.wheel["mac"]
+    assert conf.wheel["linux"]["compression"] == "stored"
+
+
+def test_real_config_wheel_compression_invalid():
+    pyproj_path = PurePosixPath("/project/pyproject.toml")
+    pyproj = {
+        "project": {"name": "foobar", "version": "1.2.3", "description": "descr"},
+        "tool": {"py-build-cmake": {"wheel": {"compression": "zstd"}}},
+    }
+    files = {"pyproject.toml": pyproj}
+    with pytest.raises(ConfigError, match="compression should be one of"):
+        process_config(pyproj_path, files, {}, test=True)
+
+
+def test_real_config_cmake_compiler_launcher():
+    pyproj_path = PurePosixPath("/project/pyproject.toml")
+    pyproj = {
+        "project": {"name": "foobar", "version": "1.2.3", "description": "descr"},
+        "tool": {
+            "py-build-cmake": {
+                "cmake": {"minimum_version": "3.18"},
+                "linux": {"cmake": {"compiler_launcher": "auto"}},
+                "mac": {"cmake": {"compiler_launcher": "sccache"}},
+            }
+        },
+    }
+    files = {"pyproject.toml": pyproj}
+    conf = process_config(pyproj_path, files, {}, test=True)
+    assert conf.cmake is not None
+    assert conf.cmake["linux"]["0"]["compiler_launcher"] == "auto"
+    assert conf.cmake["mac"]["0"]["compiler_launcher"] == "sccache"
+    # No compiler launcher by default
+    assert "compiler_launcher" not in conf.cmake["windows"]["0"]
+
+
+def test_real_config_cmake_compiler_launcher_invalid():
+    pyproj_path = PurePosixPath("/project/pyproject.toml")
+    pyproj = {
+        "project": {"name": "foobar", "version": "1.2.3", "description": "descr"},
+        "tool": {"py-build-cmake": {"cmake": {"compiler_launcher": ["ccache"]}}},
+    }
+    files = {"pyproject.toml": pyproj}
+    with pytest.raises(ConfigError, match="compiler_launcher should be"):
+        process_config(pyproj_path, files, {}, test=True)
+
+
 def test_real_config_local_override():
     pyproj_path = PurePosixPath("/project/pyproject.toml")
     pyproj = {
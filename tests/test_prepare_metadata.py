@@ -0,0 +1,56 @@
+from zipfile import ZipFile
+
+import pytest
+
+from py_build_cmake import build
+
+PYPROJECT = """\
+[project]
+name = "foo-bar"
+version = "1.2.3"
+description = "Test project"
+dependencies = ["numpy"]
+
+[project.scripts]
+foo = "foo_bar:main"
+
+[tool.py-build-cmake]
+
+[build-system]
+requires = ["py-build-cmake"]
+build-backend = "py_build_cmake.build"
+"""
+
+
+@pytest.fixture()
+def project(tmp_path, monkeypatch):
+    src_dir = tmp_path / "src"
+    (src_dir / "foo_bar").mkdir(parents=True)
+    (src_dir / "foo_bar" / "__init__.py").write_text("def main(): pass\n")
+    (src_dir / "pyproject.toml").write_text(PYPROJECT)
+    monkeypatch.chdir(src_dir)
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    ("prepare", "build_fn"),
+    [
+        (build.prepare_metadata_for_build_wheel, build.build_wheel),
+        (build.prepare_metadata_for_build_editable, build.build_editable),
+    ],
+)
+def test_prepare_metadata_matches_wheel(project, prepare, build_fn):
+    metadata_dir = project / "metadata"
+    metadata_dir.mkdir()
+    distinfo_name = prepare(str(metadata_dir))
+    assert distinfo_name == "foo_bar-1.2.3.dist-info"
+    distinfo_dir = metadata_dir / distinfo_name
+    assert not (distinfo_dir / "RECORD").exists()
+
+    wheel_dir = project / "dist"
+    wheel_dir.mkdir()
+    wheel_name = build_fn(str(wheel_dir))
+    with ZipFile(wheel_dir / wheel_name) as whl:
+        for name in "METADATA", "WHEEL", "entry_points.txt":
+            expected = whl.read(f"{distinfo_name}/{name}").decode()
+            assert (distinfo_dir / name).read_text() == expected